@@ -1,6 +1,5 @@
 import re
 from collections.abc import Mapping, Sequence
-from functools import cached_property
 from typing import TYPE_CHECKING, Any, NamedTuple, Optional, TypeVar, Union
 
 import dagster_shared.seven as seven
@@ -10,6 +9,7 @@
 from dagster._annotations import PublicAttr, public
 from dagster._record import IHaveNew, record_custom
 from dagster._serdes import whitelist_for_serdes
+from dagster._utils.interning import BoundedInternPool
 
 ASSET_KEY_SPLIT_REGEX = re.compile("[^a-zA-Z0-9_]")
 ASSET_KEY_DELIMITER = "/"
@@ -19,6 +19,11 @@
     from dagster._core.definitions.assets.definition.assets_definition import AssetsDefinition
     from dagster._core.definitions.source_asset import SourceAsset
 
+_MAX_INTERNED_ASSET_KEYS = 65536
+_interned_asset_keys: BoundedInternPool[tuple[type, tuple[str, ...]], "AssetKey"] = (
+    BoundedInternPool(_MAX_INTERNED_ASSET_KEYS)
+)
+
 
 def parse_asset_key_string(s: str) -> Sequence[str]:
     return list(filter(lambda x: x, re.split(ASSET_KEY_SPLIT_REGEX, s)))
@@ -61,11 +66,14 @@ def __new__(
         else:
             parts = tuple(check.sequence_param(path, "path", of_type=str))
 
-        return super().__new__(cls, parts=parts)
+        new = super().__new__
+        return _interned_asset_keys.intern((cls, parts), lambda: new(cls, parts=parts))
 
     @public
-    @cached_property
+    @property
     def path(self) -> Sequence[str]:
+        # equal keys are interned to one shared instance, so hand out a fresh list each time
+        # rather than caching one that a caller could mutate
         return list(self.parts)
 
     def __str__(self):
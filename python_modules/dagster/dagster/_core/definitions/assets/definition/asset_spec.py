@@ -280,7 +280,7 @@ def partition_mappings(self) -> Mapping[AssetKey, PartitionMapping]:
             if dep.partition_mapping is not None
         }
 
-    @property
+    @cached_property
     def auto_materialize_policy(self) -> Optional[AutoMaterializePolicy]:
         return (
             self.automation_condition.as_auto_materialize_policy()
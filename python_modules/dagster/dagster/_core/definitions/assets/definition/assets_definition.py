@@ -838,7 +838,7 @@ def specs_by_key(self) -> Mapping[AssetKey, AssetSpec]:
         return self._specs_by_key
 
     @public
-    @property
+    @cached_property
     def group_names_by_key(self) -> Mapping[AssetKey, str]:
         """Mapping[AssetKey, str]: Returns a mapping from the asset keys in this AssetsDefinition
         to the group names assigned to them. If there is no assigned group name for a given AssetKey,
@@ -847,7 +847,7 @@ def group_names_by_key(self) -> Mapping[AssetKey, str]:
         return {key: check.not_none(spec.group_name) for key, spec in self._specs_by_key.items()}
 
     @public
-    @property
+    @cached_property
     def descriptions_by_key(self) -> Mapping[AssetKey, str]:
         """Mapping[AssetKey, str]: Returns a mapping from the asset keys in this AssetsDefinition
         to the descriptions assigned to them. If there is no assigned description for a given AssetKey,
@@ -1114,7 +1114,7 @@ def partitions_def(self) -> Optional[PartitionsDefinition]:
                 "Different assets within this AssetsDefinition have different PartitionsDefinitions"
             )
 
-    @property
+    @cached_property
     def metadata_by_key(self) -> Mapping[AssetKey, ArbitraryMetadataMapping]:
         return {
             key: spec.metadata
@@ -1122,7 +1122,7 @@ def metadata_by_key(self) -> Mapping[AssetKey, ArbitraryMetadataMapping]:
             if spec.metadata is not None
         }
 
-    @property
+    @cached_property
     def tags_by_key(self) -> Mapping[AssetKey, Mapping[str, str]]:
         return {key: spec.tags or {} for key, spec in self._specs_by_key.items()}
 
@@ -1130,7 +1130,7 @@ def tags_by_key(self) -> Mapping[AssetKey, Mapping[str, str]]:
     def code_versions_by_key(self) -> Mapping[AssetKey, Optional[str]]:
         return {key: spec.code_version for key, spec in self._specs_by_key.items()}
 
-    @property
+    @cached_property
     def owners_by_key(self) -> Mapping[AssetKey, Sequence[str]]:
         return {key: spec.owners or [] for key, spec in self._specs_by_key.items()}
 
@@ -536,10 +536,17 @@ def get_sensor_def(self, name: str) -> SensorDefinition:
 
     # TODO: after dagster 1.11, this will become the implementation of get_sensor_def -- schrockn 2025-06-02
     def get_unresolved_sensor_def(self, name: str) -> SensorDefinition:
+        sensor = self._get_unresolved_sensors_by_name().get(name)
+        if sensor is None:
+            raise ValueError(f"SensorDefinition with name {name} not found")
+        return sensor
+
+    @cached_method
+    def _get_unresolved_sensors_by_name(self) -> Mapping[str, SensorDefinition]:
+        sensors_by_name = {}
         for sensor in self.sensors or []:
-            if sensor.name == name:
-                return sensor
-        raise ValueError(f"SensorDefinition with name {name} not found")
+            sensors_by_name.setdefault(sensor.name, sensor)
+        return sensors_by_name
 
     def resolve_sensor_def(self, name: str) -> SensorDefinition:
         check.str_param(name, "name")
@@ -558,15 +565,23 @@ def get_schedule_def(self, name: str) -> ScheduleDefinition:
 
     # TODO: after dagster 1.11, this will become the implementation of get_schedule_def -- schrockn 2025-06-02
     def get_unresolved_schedule_def(self, name: str) -> ScheduleDefinition:
-        for schedule in self.schedules or []:
-            if schedule.name == name:
-                if isinstance(schedule, ScheduleDefinition):
-                    return schedule
-                raise ValueError(
-                    f"ScheduleDefinition with name {name} is an UnresolvedPartitionedAssetScheduleDefinition, which is not supported in get_unresolved_schedule_def"
-                )
+        schedule = self._get_unresolved_schedules_by_name().get(name)
+        if schedule is None:
+            raise ValueError(f"ScheduleDefinition with name {name} not found")
+        if not isinstance(schedule, ScheduleDefinition):
+            raise ValueError(
+                f"ScheduleDefinition with name {name} is an UnresolvedPartitionedAssetScheduleDefinition, which is not supported in get_unresolved_schedule_def"
+            )
+        return schedule
 
-        raise ValueError(f"ScheduleDefinition with name {name} not found")
+    @cached_method
+    def _get_unresolved_schedules_by_name(
+        self,
+    ) -> Mapping[str, Union[ScheduleDefinition, UnresolvedPartitionedAssetScheduleDefinition]]:
+        schedules_by_name = {}
+        for schedule in self.schedules or []:
+            schedules_by_name.setdefault(schedule.name, schedule)
+        return schedules_by_name
 
     def resolve_schedule_def(self, name: str) -> ScheduleDefinition:
         check.str_param(name, "name")
@@ -646,6 +661,7 @@ def get_implicit_global_asset_job_def(self) -> JobDefinition:
         )
         return self.get_repository_def().get_implicit_global_asset_job_def()
 
+    @cached_method
     def resolve_implicit_global_asset_job_def(self) -> JobDefinition:
         """A useful conveninence method when there is a single defined global asset job.
         This occurs when all assets in the project use a single partitioning scheme.
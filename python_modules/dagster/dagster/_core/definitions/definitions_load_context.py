@@ -185,22 +185,28 @@ def defs_from_state(self, state: TState) -> Definitions:
         ...
 
     def get_or_fetch_state(self) -> TState:
-        context = DefinitionsLoadContext.get()
-        state = (
-            cast("TState", deserialize_value(context.reconstruction_metadata[self.defs_key]))
-            if (
-                context.load_type == DefinitionsLoadType.RECONSTRUCTION
-                and self.defs_key in context.reconstruction_metadata
-            )
-            else self.fetch_state()
-        )
-        context.add_to_pending_reconstruction_metadata(self.defs_key, serialize_value(state))
-
+        state, _ = self._get_or_fetch_state_and_serialized_state()
         return state
 
+    def _get_or_fetch_state_and_serialized_state(self) -> tuple[TState, str]:
+        context = DefinitionsLoadContext.get()
+        if (
+            context.load_type == DefinitionsLoadType.RECONSTRUCTION
+            and self.defs_key in context.reconstruction_metadata
+        ):
+            # Reuse the stored string rather than re-serializing the state we just parsed from it.
+            serialized_state = context.reconstruction_metadata[self.defs_key]
+            state = cast("TState", deserialize_value(serialized_state))
+        else:
+            state = self.fetch_state()
+            serialized_state = serialize_value(state)
+        context.add_to_pending_reconstruction_metadata(self.defs_key, serialized_state)
+
+        return state, serialized_state
+
     def build_defs(self) -> Definitions:
-        state = self.get_or_fetch_state()
+        state, serialized_state = self._get_or_fetch_state_and_serialized_state()
 
         return self.defs_from_state(state).with_reconstruction_metadata(
-            {self.defs_key: serialize_value(state)}
+            {self.defs_key: serialized_state}
         )
@@ -19,7 +19,8 @@
 
 
 def external_asset_from_spec(spec: AssetSpec) -> AssetsDefinition:
-    return external_assets_from_specs([spec])[0]
+    # call the implementation directly so that each spec doesn't emit a deprecation warning
+    return _external_assets_from_specs([spec])[0]
 
 
 @deprecated(breaking_version="1.9.0", additional_warn_text="Directly use the AssetSpecs instead.")
@@ -88,7 +89,11 @@ def external_assets_from_specs(specs: Sequence[AssetSpec]) -> list[AssetsDefinit
     Args:
         specs (Sequence[AssetSpec]): The specs for the assets.
     """
-    assets_defs = []
+    return _external_assets_from_specs(specs)
+
+
+def _external_assets_from_specs(specs: Sequence[AssetSpec]) -> list[AssetsDefinition]:
+    # validate every spec before building any definitions
     for spec in specs:
         check.invariant(
             spec.auto_materialize_policy is None,
@@ -100,10 +105,8 @@ def external_assets_from_specs(specs: Sequence[AssetSpec]) -> list[AssetsDefinit
             "skippable must be False since it is ignored and False is the default",
         )
 
-        with disable_dagster_warnings():
-            assets_defs.append(AssetsDefinition(specs=[spec]))
-
-    return assets_defs
+    with disable_dagster_warnings():
+        return [AssetsDefinition(specs=[spec]) for spec in specs]
 
 
 def create_external_asset_from_source_asset(source_asset: SourceAsset) -> AssetsDefinition:
@@ -465,8 +465,12 @@ def __repr__(self):
             f" cron_schedule='{self.cron_schedule}')"
         )
 
+    # Hashing builds the full repr, and instances are hashed on every call to the lru_cache'd
+    # methods below, so compute it once per instance
     def __hash__(self):
-        return hash(tuple(self.__repr__()))
+        if not hasattr(self, "_hash"):
+            self._hash = hash(tuple(self.__repr__()))
+        return self._hash
 
     @functools.lru_cache(maxsize=100)
     def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
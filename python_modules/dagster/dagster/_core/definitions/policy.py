@@ -1,10 +1,12 @@
 from enum import Enum
+from functools import cached_property
 from random import random
 from typing import NamedTuple, Optional
 
 import dagster._check as check
 from dagster._annotations import PublicAttr
 from dagster._core.errors import DagsterInvalidDefinitionError
+from dagster._utils.interning import BoundedInternPool
 
 
 class Backoff(Enum):
@@ -29,6 +31,12 @@ class Jitter(Enum):
     PLUS_MINUS = "PLUS_MINUS"
 
 
+_MAX_INTERNED_RETRY_POLICIES = 1024
+_interned_retry_policies: BoundedInternPool[tuple, "RetryPolicy"] = BoundedInternPool(
+    _MAX_INTERNED_RETRY_POLICIES
+)
+
+
 class RetryPolicy(
     NamedTuple(
         "_RetryPolicy",
@@ -73,35 +81,65 @@ def __new__(
                 "Can not set backoff on RetryPolicy without also setting delay"
             )
 
-        return super().__new__(
-            cls,
-            max_retries=check.int_param(max_retries, "max_retries"),
-            delay=check.opt_numeric_param(delay, "delay"),
-            backoff=check.opt_inst_param(backoff, "backoff", Backoff),
-            jitter=check.opt_inst_param(jitter, "jitter", Jitter),
+        max_retries = check.int_param(max_retries, "max_retries")
+        delay = check.opt_numeric_param(delay, "delay")
+        backoff = check.opt_inst_param(backoff, "backoff", Backoff)
+        jitter = check.opt_inst_param(jitter, "jitter", Jitter)
+
+        # the delay type is part of the key so that e.g. delay=1 and delay=1.0 stay distinct
+        key = (cls, max_retries, type(delay), delay, backoff, jitter)
+        new = super().__new__
+        return _interned_retry_policies.intern(
+            key,
+            lambda: new(
+                cls,
+                max_retries=max_retries,
+                delay=delay,
+                backoff=backoff,
+                jitter=jitter,
+            ),
         )
 
-    def calculate_delay(self, attempt_num: int) -> check.Numeric:
-        return calculate_delay(
-            attempt_num=attempt_num,
-            backoff=self.backoff,
-            jitter=self.jitter,
-            base_delay=self.delay or 0,
+    @cached_property
+    def _backoff_delays(self) -> tuple[float, ...]:
+        # the backoff delay only depends on the attempt number, so tabulate it once per policy
+        num_attempts = min(self.max_retries, _MAX_TABULATED_ATTEMPTS)
+        return tuple(
+            _backoff_delay(attempt_num, self.backoff, self.delay or 0)
+            for attempt_num in range(1, num_attempts + 1)
         )
 
+    def calculate_delay(self, attempt_num: int) -> check.Numeric:
+        backoff_delays = self._backoff_delays
+        if 0 < attempt_num <= len(backoff_delays):
+            backoff_delay = backoff_delays[attempt_num - 1]
+        else:
+            backoff_delay = _backoff_delay(attempt_num, self.backoff, self.delay or 0)
+
+        return _apply_jitter(backoff_delay, self.jitter, self.delay or 0)
+
+
+_MAX_TABULATED_ATTEMPTS = 64
+
 
 def calculate_delay(
     attempt_num: int, backoff: Optional[Backoff], jitter: Optional[Jitter], base_delay: float
 ) -> float:
+    return _apply_jitter(_backoff_delay(attempt_num, backoff, base_delay), jitter, base_delay)
+
+
+def _backoff_delay(attempt_num: int, backoff: Optional[Backoff], base_delay: float) -> float:
     if backoff is Backoff.EXPONENTIAL:
-        calc_delay = ((2**attempt_num) - 1) * base_delay
+        return ((2**attempt_num) - 1) * base_delay
     elif backoff is Backoff.LINEAR:
-        calc_delay = base_delay * attempt_num
+        return base_delay * attempt_num
     elif backoff is None:
-        calc_delay = base_delay
+        return base_delay
     else:
         check.assert_never(backoff)
 
+
+def _apply_jitter(calc_delay: float, jitter: Optional[Jitter], base_delay: float) -> float:
     if jitter is Jitter.FULL:
         calc_delay = random() * calc_delay
     elif jitter is Jitter.PLUS_MINUS:
@@ -122,6 +122,7 @@ def __init__(
         self._repository_load_data = check.opt_inst_param(
             repository_load_data, "repository_load_data", RepositoryLoadData
         )
+        self._all_definitions_loaded = False
 
     @property
     def repository_load_data(self) -> Optional[RepositoryLoadData]:
@@ -178,7 +179,10 @@ def metadata(self) -> Optional[MetadataMapping]:
 
     def load_all_definitions(self) -> None:
         # force load of all lazy constructed code artifacts
+        if self._all_definitions_loaded:
+            return
         self._repository_data.load_all_definitions()
+        self._all_definitions_loaded = True
 
     def validate_loadable(self):
         self.load_all_definitions()
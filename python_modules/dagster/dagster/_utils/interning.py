@@ -0,0 +1,52 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Callable, Generic, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BoundedInternPool(Generic[K, V]):
+    """A size-bounded pool of canonical instances, evicting the least recently used entry once full.
+
+    Used to share a single instance among equal immutable values. Tuple-based values such as
+    records cannot be weakly referenced, so the pool holds strong references and relies on the
+    bound to keep memory in check in long-lived processes.
+    """
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._values: OrderedDict[K, V] = OrderedDict()
+
+    def get(self, key: K) -> Optional[V]:
+        value = self._values.get(key)
+        if value is not None:
+            try:
+                self._values.move_to_end(key)
+            except KeyError:
+                # evicted by another thread since the lookup above
+                pass
+        return value
+
+    def intern(self, key: K, factory: Callable[[], V]) -> V:
+        """Return the pooled value for key, creating it with factory and pooling it if absent.
+
+        Keys should include the type being constructed, so that subclasses never receive an
+        instance of their parent class.
+        """
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.add(key, value)
+        return value
+
+    def add(self, key: K, value: V) -> None:
+        self._values[key] = value
+        if len(self._values) > self._maxsize:
+            try:
+                self._values.popitem(last=False)
+            except KeyError:
+                pass
+
+    def __len__(self) -> int:
+        return len(self._values)
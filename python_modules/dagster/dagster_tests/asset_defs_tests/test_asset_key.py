@@ -68,3 +68,16 @@ def test_to_asset_key_path():
     assert AssetKey.from_escaped_user_string(r"foo\/bar\/baz").path == ["foo/bar/baz"]
     assert AssetKey.from_escaped_user_string(r"foo\/bar/baz").path == ["foo/bar", "baz"]
     assert AssetKey.from_escaped_user_string(r"foo/bar\/baz").path == ["foo", "bar/baz"]
+
+
+def test_asset_key_interned():
+    assert AssetKey(["interned", "key"]) is AssetKey(("interned", "key"))
+    assert AssetKey.from_coercible("interned_key") is AssetKey(["interned_key"])
+
+
+def test_asset_key_path_not_shared():
+    key = AssetKey(["shared", "path"])
+    path = key.path
+    path.append("mutated")  # pyright: ignore[reportAttributeAccessIssue]
+    assert AssetKey(["shared", "path"]).path == ["shared", "path"]
+    assert key.path == ["shared", "path"]
@@ -188,3 +188,9 @@ def defs_from_state(self, state: ExampleDefState) -> dg.Definitions:
         defs = loader_cached.build_defs()
         assert len(defs.resolve_all_asset_specs()) == 1
         assert defs.resolve_assets_def("bar")
+        # the stored state string is carried forward as-is instead of being re-serialized
+        context = DefinitionsLoadContext.get()
+        assert (
+            context.get_pending_reconstruction_metadata()["test_key"]
+            is context.reconstruction_metadata["test_key"]
+        )
@@ -1,5 +1,5 @@
-from collections.abc import Iterable
-from typing import AbstractSet  # noqa: UP035
+import warnings
+from typing import TYPE_CHECKING
 
 import dagster as dg
 import pytest
@@ -13,77 +13,77 @@
 )
 from dagster._core.definitions.external_asset import (
     create_external_asset_from_source_asset,
+    external_asset_from_spec,
     external_assets_from_specs,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+    from typing import AbstractSet  # noqa: UP035
 
-def test_external_asset_basic_creation() -> None:
-    assets_def = next(
-        iter(
-            external_assets_from_specs(
-                specs=[
-                    dg.AssetSpec(
-                        key="external_asset_one",
-                        description="desc",
-                        metadata={"user_metadata": "value"},
-                        group_name="a_group",
-                    )
-                ]
-            )
-        )
-    )
-    assert isinstance(assets_def, dg.AssetsDefinition)
 
-    expected_key = dg.AssetKey(["external_asset_one"])
+class DummyIOManager(dg.IOManager):
+    def handle_output(self, context, obj) -> None:
+        pass
 
-    assert assets_def.key == expected_key
-    # will work once https://github.com/dagster-io/dagster/pull/16755 merges
-    # assert assets_def.descriptions_by_key[expected_key] == "desc"
-    assert assets_def.metadata_by_key[expected_key]["user_metadata"] == "value"
-    assert assets_def.group_names_by_key[expected_key] == "a_group"
-    assert assets_def.descriptions_by_key[expected_key] == "desc"
-    assert not assets_def.is_executable
+    def load_input(self, context) -> str:
+        return "hardcoded"
 
 
-def test_external_asset_tags_owners() -> None:
-    assets_def = next(
-        iter(
-            external_assets_from_specs(
-                specs=[
-                    dg.AssetSpec(
-                        key="external_asset_one",
-                        tags={"foo": "bar", "baz": "qux"},
-                        owners=["ben@dagsterlabs.com"],
-                    )
-                ]
-            )
-        )
-    )
-    assert isinstance(assets_def, dg.AssetsDefinition)
-    expected_key = dg.AssetKey(["external_asset_one"])
-    assert assets_def.tags_by_key[expected_key] == {"foo": "bar", "baz": "qux"}
-    assert assets_def.owners_by_key[expected_key] == ["ben@dagsterlabs.com"]
-
-
-def test_external_asset_with_hyphens() -> None:
-    key = dg.AssetKey(["with-hyphen", "external_asset_one"])
-    assets_def = next(
-        iter(
-            external_assets_from_specs(
-                specs=[
-                    dg.AssetSpec(
-                        key=key,
-                    )
-                ]
-            )
-        )
-    )
+_DUMMY_IO_MANAGER = DummyIOManager()
+
+
+@pytest.fixture(name="instance", scope="module")
+def instance_fixture() -> "Iterator[DagsterInstance]":
+    with DagsterInstance.ephemeral() as instance:
+        yield instance
+
+
+@pytest.mark.parametrize(
+    "spec, expected_attrs",
+    [
+        (
+            dg.AssetSpec(
+                key="external_asset_one",
+                description="desc",
+                metadata={"user_metadata": "value"},
+                group_name="a_group",
+            ),
+            {
+                "metadata_by_key": {"user_metadata": "value"},
+                "group_names_by_key": "a_group",
+                "descriptions_by_key": "desc",
+            },
+        ),
+        (
+            dg.AssetSpec(
+                key="external_asset_one",
+                tags={"foo": "bar", "baz": "qux"},
+                owners=["ben@dagsterlabs.com"],
+            ),
+            {
+                "tags_by_key": {"foo": "bar", "baz": "qux"},
+                "owners_by_key": ["ben@dagsterlabs.com"],
+            },
+        ),
+        (dg.AssetSpec(key=dg.AssetKey(["with-hyphen", "external_asset_one"])), {}),
+    ],
+    ids=["basic", "tags_owners", "with_hyphens"],
+)
+def test_external_asset_single_spec(
+    spec: dg.AssetSpec, expected_attrs: "Mapping[str, object]"
+) -> None:
+    assets_def = external_assets_from_specs(specs=[spec])[0]
     assert isinstance(assets_def, dg.AssetsDefinition)
-    assert assets_def.key == key
+
+    assert assets_def.key == spec.key
+    for attr_name, expected_value in expected_attrs.items():
+        assert getattr(assets_def, attr_name)[spec.key] == expected_value
+    assert not assets_def.is_executable
 
 
 def test_multi_external_asset_basic_creation() -> None:
-    for assets_def in external_assets_from_specs(
+    assets_defs = external_assets_from_specs(
         specs=[
             dg.AssetSpec(
                 key="external_asset_one",
@@ -98,20 +98,31 @@ def test_multi_external_asset_basic_creation() -> None:
                 group_name="a_group",
             ),
         ]
-    ):
-        assert isinstance(assets_def, dg.AssetsDefinition)
+    )
+    assert len(assets_defs) == 2
+    assert all(type(assets_def) is dg.AssetsDefinition for assets_def in assets_defs)
 
 
-def test_invalid_external_asset_creation() -> None:
-    invalid_specs = [
+def test_external_asset_from_spec_does_not_warn() -> None:
+    # only external_assets_from_specs is deprecated
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assets_def = external_asset_from_spec(dg.AssetSpec("external_asset"))
+    assert assets_def.key == AssetKey("external_asset")
+
+
+@pytest.mark.parametrize(
+    "invalid_spec",
+    [
         dg.AssetSpec("invalid_asset1", auto_materialize_policy=AutoMaterializePolicy.eager()),
         dg.AssetSpec("invalid_asset2", code_version="ksjdfljs"),
-        dg.AssetSpec("invalid_asset2", skippable=True),
-    ]
-
-    for invalid_spec in invalid_specs:
-        with pytest.raises(check.CheckError):
-            external_assets_from_specs(specs=[invalid_spec])
+        dg.AssetSpec("invalid_asset3", skippable=True),
+    ],
+    ids=["auto_materialize_policy", "code_version", "skippable"],
+)
+def test_invalid_external_asset_creation(invalid_spec: dg.AssetSpec) -> None:
+    with pytest.raises(check.CheckError):
+        external_assets_from_specs(specs=[invalid_spec])
 
 
 def test_normal_asset_materializeable() -> None:
@@ -121,39 +132,31 @@ def an_asset() -> None: ...
     assert an_asset.is_executable
 
 
+_EXPECTED_DEPS = {
+    dg.AssetKey(["external_asset_one"]): frozenset({dg.AssetKey(["external_asset_two"])})
+}
+
+
 def test_external_asset_creation_with_deps() -> None:
     asset_two = dg.AssetSpec("external_asset_two")
-    assets_def = next(
-        iter(
-            external_assets_from_specs(
-                [
-                    dg.AssetSpec(
-                        "external_asset_one",
-                        deps=[asset_two.key],  # todo remove key when asset deps accepts it
-                    )
-                ]
+    assets_def = external_assets_from_specs(
+        [
+            dg.AssetSpec(
+                "external_asset_one",
+                deps=[asset_two.key],  # todo remove key when asset deps accepts it
             )
-        )
-    )
+        ]
+    )[0]
     assert isinstance(assets_def, dg.AssetsDefinition)
 
     expected_key = dg.AssetKey(["external_asset_one"])
 
     assert assets_def.key == expected_key
-    assert assets_def.asset_deps[expected_key] == {
-        dg.AssetKey(["external_asset_two"]),
-    }
-
+    assert assets_def.asset_deps == _EXPECTED_DEPS
 
-def test_how_source_assets_are_backwards_compatible() -> None:
-    class DummyIOManager(dg.IOManager):
-        def handle_output(self, context, obj) -> None:
-            pass
 
-        def load_input(self, context) -> str:
-            return "hardcoded"
-
-    source_asset = dg.SourceAsset(key="source_asset", io_manager_def=DummyIOManager())
+def test_how_source_assets_are_backwards_compatible(instance: DagsterInstance) -> None:
+    source_asset = dg.SourceAsset(key="source_asset", io_manager_def=_DUMMY_IO_MANAGER)
 
     @dg.asset
     def an_asset(source_asset: str) -> str:
@@ -161,8 +164,6 @@ def an_asset(source_asset: str) -> str:
 
     defs_with_source = dg.Definitions(assets=[source_asset, an_asset])
 
-    instance = DagsterInstance.ephemeral()
-
     result_one = defs_with_source.resolve_implicit_global_asset_job_def().execute_in_process(
         instance=instance
     )
@@ -188,73 +189,66 @@ def an_asset(source_asset: str) -> str:
 
 def get_job_for_assets(defs: Definitions, *coercibles_or_defs) -> dg.JobDefinition:
     job_def = defs.resolve_implicit_job_def_def_for_assets(
-        set_from_coercibles_or_defs(coercibles_or_defs)
+        set_from_coercibles_or_defs(*coercibles_or_defs)
     )
     assert job_def, "Expected to find a job def"
     return job_def
 
 
-def set_from_coercibles_or_defs(coercibles_or_defs: Iterable) -> AbstractSet["AssetKey"]:
-    return set(
-        [
-            AssetKey.from_coercible_or_definition(coercible_or_def)
-            for coercible_or_def in coercibles_or_defs
-        ]
-    )
-
-
-def test_how_partitioned_source_assets_are_backwards_compatible() -> None:
-    class DummyIOManager(dg.IOManager):
-        def handle_output(self, context, obj) -> None:
-            pass
+def set_from_coercibles_or_defs(*coercibles_or_defs) -> "AbstractSet[AssetKey]":
+    return {
+        AssetKey.from_coercible_or_definition(coercible_or_def)
+        for coercible_or_def in coercibles_or_defs
+    }
 
-        def load_input(self, context) -> str:
-            return "hardcoded"
 
+def test_how_partitioned_source_assets_are_backwards_compatible(instance: DagsterInstance) -> None:
     partitions_def = dg.DailyPartitionsDefinition(start_date="2021-01-01")
     source_asset = dg.SourceAsset(
-        key="source_asset", io_manager_def=DummyIOManager(), partitions_def=partitions_def
+        key="partitioned_source_asset",
+        io_manager_def=_DUMMY_IO_MANAGER,
+        partitions_def=partitions_def,
     )
 
     @dg.asset(partitions_def=partitions_def)
-    def an_asset(context: AssetExecutionContext, source_asset: str) -> str:
-        return source_asset + "-computed-" + context.partition_key
+    def a_partitioned_asset(context: AssetExecutionContext, partitioned_source_asset: str) -> str:
+        return partitioned_source_asset + "-computed-" + context.partition_key
 
-    assert an_asset.partitions_def is partitions_def
+    assert a_partitioned_asset.partitions_def is partitions_def
     assert source_asset.partitions_def is partitions_def
 
-    defs_with_source = dg.Definitions(assets=[source_asset, an_asset])
-
-    instance = DagsterInstance.ephemeral()
+    defs_with_source = dg.Definitions(assets=[source_asset, a_partitioned_asset])
 
-    job_def_without_shim = get_job_for_assets(defs_with_source, an_asset)
+    job_def_without_shim = get_job_for_assets(defs_with_source, a_partitioned_asset)
 
     result_one = job_def_without_shim.execute_in_process(
         instance=instance, partition_key="2021-01-02"
     )
 
     assert result_one.success
-    assert result_one.output_for_node("an_asset") == "hardcoded-computed-2021-01-02"
+    assert result_one.output_for_node("a_partitioned_asset") == "hardcoded-computed-2021-01-02"
 
     shimmed_source_asset = create_external_asset_from_source_asset(source_asset)
-    defs_with_shim = dg.Definitions(assets=[shimmed_source_asset, an_asset])
+    defs_with_shim = dg.Definitions(assets=[shimmed_source_asset, a_partitioned_asset])
 
-    assert isinstance(defs_with_shim.resolve_assets_def("source_asset"), dg.AssetsDefinition)
+    assert isinstance(
+        defs_with_shim.resolve_assets_def("partitioned_source_asset"), dg.AssetsDefinition
+    )
 
-    job_def_with_shim = get_job_for_assets(defs_with_shim, an_asset)
+    job_def_with_shim = get_job_for_assets(defs_with_shim, a_partitioned_asset)
 
     result_two = job_def_with_shim.execute_in_process(
         instance=instance,
         # currently we have to explicitly select the asset to exclude the source from execution
-        asset_selection=[dg.AssetKey("an_asset")],
+        asset_selection=[dg.AssetKey("a_partitioned_asset")],
         partition_key="2021-01-03",
     )
 
     assert result_two.success
-    assert result_two.output_for_node("an_asset") == "hardcoded-computed-2021-01-03"
+    assert result_two.output_for_node("a_partitioned_asset") == "hardcoded-computed-2021-01-03"
 
 
-def test_observable_source_asset_decorator() -> None:
+def test_observable_source_asset_decorator(instance: DagsterInstance) -> None:
     freshness_policy = dg.LegacyFreshnessPolicy(maximum_lag_minutes=30)
 
     @dg.observable_source_asset(legacy_freshness_policy=freshness_policy)
@@ -270,7 +264,6 @@ def an_observable_source_asset() -> dg.DataVersion:
     )
     defs = dg.Definitions(assets=[assets_def])
 
-    instance = DagsterInstance.ephemeral()
     result = defs.resolve_implicit_global_asset_job_def().execute_in_process(instance=instance)
 
     assert result.success
@@ -285,34 +278,35 @@ def an_observable_source_asset() -> dg.DataVersion:
     assert len(all_materializations) == 0
 
 
-def test_external_assets_with_dependencies_manual_construction() -> None:
-    upstream_asset = dg.AssetSpec("upstream_asset")
-    downstream_asset = dg.AssetSpec("downstream_asset", deps=[upstream_asset])
+upstream_asset = dg.AssetSpec("upstream_asset")
+downstream_asset = dg.AssetSpec("downstream_asset", deps=[upstream_asset])
 
-    @dg.multi_asset(name="_generated_asset_def_1", specs=[upstream_asset])
-    def _upstream_def(context: AssetExecutionContext) -> None:
-        raise Exception("do not execute")
 
-    @dg.multi_asset(name="_generated_asset_def_2", specs=[downstream_asset])
-    def _downstream_asset(context: AssetExecutionContext) -> None:
-        raise Exception("do not execute")
+@dg.multi_asset(name="_generated_asset_def_1", specs=[upstream_asset])
+def _upstream_def(context: AssetExecutionContext) -> None:
+    raise Exception("do not execute")
 
-    defs = dg.Definitions(assets=[_upstream_def, _downstream_asset])
-    assert defs
 
-    assert defs.resolve_implicit_global_asset_job_def().asset_layer.asset_graph.get(
-        dg.AssetKey("downstream_asset")
-    ).parent_keys == {dg.AssetKey("upstream_asset")}
+@dg.multi_asset(name="_generated_asset_def_2", specs=[downstream_asset])
+def _downstream_def(context: AssetExecutionContext) -> None:
+    raise Exception("do not execute")
 
 
-def test_external_asset_multi_asset() -> None:
-    upstream_asset = dg.AssetSpec("upstream_asset")
-    downstream_asset = dg.AssetSpec("downstream_asset", deps=[upstream_asset])
+@dg.multi_asset(specs=[downstream_asset, upstream_asset])
+def _generated_asset_def(context: AssetExecutionContext):
+    raise Exception("do not execute")
 
-    @dg.multi_asset(specs=[downstream_asset, upstream_asset])
-    def _generated_asset_def(context: AssetExecutionContext):
-        raise Exception("do not execute")
 
+def test_external_assets_with_dependencies_manual_construction() -> None:
+    defs = dg.Definitions(assets=[_upstream_def, _downstream_def])
+    assert defs
+
+    assert defs.resolve_asset_graph().get(dg.AssetKey("downstream_asset")).parent_keys == {
+        dg.AssetKey("upstream_asset")
+    }
+
+
+def test_external_asset_multi_asset() -> None:
     defs = dg.Definitions(assets=[_generated_asset_def])
     assert defs
 
@@ -322,9 +316,6 @@ def _generated_asset_def(context: AssetExecutionContext):
 
 
 def test_external_assets_with_dependencies() -> None:
-    upstream_asset = dg.AssetSpec("upstream_asset")
-    downstream_asset = dg.AssetSpec("downstream_asset", deps=[upstream_asset])
-
     defs = dg.Definitions(assets=external_assets_from_specs([upstream_asset, downstream_asset]))
     assert defs
 
@@ -1,5 +1,6 @@
 from collections import defaultdict
 from typing import TYPE_CHECKING
+from unittest import mock
 
 import dagster as dg
 import pytest
@@ -1285,6 +1286,25 @@ def repo():
     repo.load_all_definitions()
 
 
+def test_load_all_definitions_only_loads_once():
+    @dg.asset
+    def asset1(): ...
+
+    @dg.repository
+    def repo():
+        return [asset1, dg.define_asset_job("the_job")]
+
+    repository_data = repo._repository_data  # noqa: SLF001
+    with mock.patch.object(
+        repository_data, "load_all_definitions", wraps=repository_data.load_all_definitions
+    ) as load_all_definitions:
+        repo.load_all_definitions()
+        repo.load_all_definitions()
+        repo.validate_loadable()
+
+    assert load_all_definitions.call_count == 1
+
+
 def test_default_loggers_repo():
     @dg.logger  # pyright: ignore[reportCallIssue,reportArgumentType]
     def basic():
@@ -0,0 +1,22 @@
+from dagster._utils.interning import BoundedInternPool
+
+
+def test_bounded_intern_pool_evicts_least_recently_used():
+    pool: BoundedInternPool[str, int] = BoundedInternPool(maxsize=2)
+    pool.add("a", 1)
+    pool.add("b", 2)
+    # touching "a" makes "b" the least recently used entry
+    assert pool.get("a") == 1
+    pool.add("c", 3)
+
+    assert len(pool) == 2
+    assert pool.get("b") is None
+    assert pool.get("a") == 1
+    assert pool.get("c") == 3
+
+
+def test_bounded_intern_pool_intern_creates_once():
+    pool: BoundedInternPool[str, list[int]] = BoundedInternPool(maxsize=2)
+    first = pool.intern("a", lambda: [1])
+    assert pool.intern("a", lambda: [2]) is first
+    assert pool.intern("b", lambda: [2]) == [2]
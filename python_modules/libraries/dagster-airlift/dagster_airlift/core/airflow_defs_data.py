@@ -19,15 +19,12 @@
 from dagster_airlift.core.serialization.serialized_data import DagHandle, TaskHandle
 from dagster_airlift.core.utils import (
     dag_handle_from_job,
-    dag_handles_for_spec,
-    get_producing_dag_ids,
     is_airflow_mapped_job,
     is_dag_mapped_asset_spec,
     is_peered_dag_asset_spec,
     is_task_mapped_asset_spec,
     peered_dag_handles_for_spec,
     spec_iterator,
-    task_handles_for_spec,
 )
 
 MappedAsset = Union[AssetSpec, AssetsDefinition]
@@ -54,7 +51,7 @@ class AirflowDefinitionsData:
     airflow_instance: AirflowInstance
     resolved_repository: RepositoryDefinition
 
-    @property
+    @cached_property
     def airflow_mapped_asset_specs(self) -> Mapping[AssetKey, AssetSpec]:
         """The assets that are mapped to Airflow tasks and dags."""
         return {
@@ -63,21 +60,21 @@ def airflow_mapped_asset_specs(self) -> Mapping[AssetKey, AssetSpec]:
             if _is_mapped_asset_spec(spec)
         }
 
-    @property
+    @cached_property
     def airflow_mapped_jobs(self) -> Sequence[JobDefinition]:
         """Jobs mapping to Airflow dags."""
         return [
             job for job in self.resolved_repository.get_all_jobs() if is_airflow_mapped_job(job)
         ]
 
-    @property
+    @cached_property
     def airflow_mapped_jobs_by_dag_handle(
         self,
     ) -> Mapping[DagHandle, JobDefinition]:
         """Jobs mapping to Airflow dags by dag_id."""
         return {dag_handle_from_job(job): job for job in self.airflow_mapped_jobs}
 
-    @property
+    @cached_property
     def assets_per_job(self) -> Mapping[str, AbstractSet[AssetKey]]:
         """Assets per job mapping to Airflow dags."""
         return {
@@ -85,13 +82,21 @@ def assets_per_job(self) -> Mapping[str, AbstractSet[AssetKey]]:
             for dag_handle, job in self.airflow_mapped_jobs_by_dag_handle.items()
         }
 
-    @property
+    @cached_property
     def assets_produced_by_dags(self) -> Mapping[str, AbstractSet[AssetKey]]:
         """Assets produced by Airflow dags."""
+        # A dag mapping takes precedence over a peered dag mapping, which takes precedence over task
+        # mappings. Handles are read from the indexes that already parsed the spec metadata.
         result = defaultdict(set)
-        for spec in self.airflow_mapped_asset_specs.values():
-            for dag_id in get_producing_dag_ids(spec):
-                result[dag_id].add(spec.key)
+        for key, spec in self.airflow_mapped_asset_specs.items():
+            if is_dag_mapped_asset_spec(spec):
+                handles = self.mapping_info.dag_handle_map[key]
+            elif is_peered_dag_asset_spec(spec):
+                handles = self.peered_dag_handles_by_asset_key[key]
+            else:
+                handles = self.mapping_info.task_handle_map[key]
+            for handle in handles:
+                result[handle.dag_id].add(key)
         return result
 
     @public
@@ -113,7 +118,7 @@ def task_ids_in_dag(self, dag_id: str) -> set[str]:
         """
         return self.mapping_info.task_id_map[dag_id]
 
-    @property
+    @cached_property
     def dag_ids_with_mapped_asset_keys(self) -> AbstractSet[str]:
         """All dag_ids that have asset keys explicitly mapped to them. This include peered dag assets."""
         # dag ids that have asset keys explicitly mapped to them, or tasks within them
@@ -127,11 +132,9 @@ def dag_ids_with_mapped_asset_keys(self) -> AbstractSet[str]:
     @cached_property
     def mapped_asset_keys_by_task_handle(self) -> Mapping[TaskHandle, AbstractSet[AssetKey]]:
         asset_keys_per_handle = defaultdict(set)
-        for spec in self.airflow_mapped_asset_specs.values():
-            if is_task_mapped_asset_spec(spec):
-                task_handles = task_handles_for_spec(spec)
-                for task_handle in task_handles:
-                    asset_keys_per_handle[task_handle].add(spec.key)
+        for asset_key, task_handles in self.mapping_info.task_handle_map.items():
+            for task_handle in task_handles:
+                asset_keys_per_handle[task_handle].add(asset_key)
         return asset_keys_per_handle
 
     # these dag handle properties are ripe for consolidation
@@ -139,24 +142,28 @@ def mapped_asset_keys_by_task_handle(self) -> Mapping[TaskHandle, AbstractSet[As
     def mapped_asset_keys_by_dag_handle(self) -> Mapping[DagHandle, AbstractSet[AssetKey]]:
         """Assets specifically mapped to each dag."""
         asset_keys_per_handle = defaultdict(set)
-        for spec in self.airflow_mapped_asset_specs.values():
-            if is_dag_mapped_asset_spec(spec):
-                dag_handles = dag_handles_for_spec(spec)
-                for dag_handle in dag_handles:
-                    asset_keys_per_handle[dag_handle].add(spec.key)
+        for asset_key, dag_handles in self.mapping_info.dag_handle_map.items():
+            for dag_handle in dag_handles:
+                asset_keys_per_handle[dag_handle].add(asset_key)
         return asset_keys_per_handle
 
     @cached_property
     def peered_dag_asset_keys_by_dag_handle(self) -> Mapping[DagHandle, AbstractSet[AssetKey]]:
         """Autogenerated "peered" dag assets."""
         asset_keys_per_handle = defaultdict(set)
-        for spec in self.airflow_mapped_asset_specs.values():
-            if is_peered_dag_asset_spec(spec):
-                dag_handles = peered_dag_handles_for_spec(spec)
-                for dag_handle in dag_handles:
-                    asset_keys_per_handle[dag_handle].add(spec.key)
+        for asset_key, dag_handles in self.peered_dag_handles_by_asset_key.items():
+            for dag_handle in dag_handles:
+                asset_keys_per_handle[dag_handle].add(asset_key)
         return asset_keys_per_handle
 
+    @cached_property
+    def peered_dag_handles_by_asset_key(self) -> Mapping[AssetKey, AbstractSet[DagHandle]]:
+        return {
+            spec.key: peered_dag_handles_for_spec(spec)
+            for spec in self.airflow_mapped_asset_specs.values()
+            if is_peered_dag_asset_spec(spec)
+        }
+
     @cached_property
     def all_asset_keys_by_dag_handle(self) -> Mapping[DagHandle, AbstractSet[AssetKey]]:
         """All asset keys mapped to each dag."""
@@ -2,7 +2,7 @@
 import time
 from abc import ABC
 from collections.abc import Sequence
-from typing import Any, Optional
+from typing import AbstractSet, Any, Optional  # noqa: UP035
 
 import requests
 from dagster._annotations import beta, public
@@ -30,6 +30,7 @@
 # Airflow dag run batch API: https://airflow.apache.org/docs/apache-airflow/stable/stable-rest-api-ref.html#operation/get_dag_runs_batch
 DEFAULT_BATCH_DAG_RUNS_LIMIT = 100
 DEFAULT_DAG_LIST_LIMIT = 100
+DEFAULT_MAX_CONCURRENT_REQUESTS = 1
 SLEEP_SECONDS = 1
 
 
@@ -62,6 +63,8 @@ class AirflowInstance:
         name (str): The name of the Airflow instance. This will be prefixed to any assets automatically created using this instance.
         batch_task_instance_limit (int): The number of task instances to query at a time when fetching task instances. Defaults to 100.
         batch_dag_runs_limit (int): The number of dag runs to query at a time when fetching dag runs. Defaults to 100.
+        max_concurrent_requests (int): The number of requests to make at once when fetching task information for many dags.
+            Defaults to 1, which fetches sequentially. Values above 1 require the auth backend to be safe to use from multiple threads.
     """
 
     def __init__(
@@ -71,12 +74,14 @@ def __init__(
         batch_task_instance_limit: int = DEFAULT_BATCH_TASK_RETRIEVAL_LIMIT,
         batch_dag_runs_limit: int = DEFAULT_BATCH_DAG_RUNS_LIMIT,
         dag_list_limit: int = DEFAULT_DAG_LIST_LIMIT,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
     ) -> None:
         self.auth_backend = auth_backend
         self.name = check_valid_name(name)
         self.batch_task_instance_limit = batch_task_instance_limit
         self.batch_dag_runs_limit = batch_dag_runs_limit
         self.dag_list_limit = dag_list_limit
+        self.max_concurrent_requests = max_concurrent_requests
 
     @property
     def normalized_name(self) -> str:
@@ -447,7 +452,7 @@ def _get_datasets(
         limit: int,
         offset: int,
         retrieval_filter: AirflowFilter,
-        dag_ids: Optional[Sequence[str]],
+        dag_ids: Optional[AbstractSet[str]],
     ) -> Sequence["Dataset"]:
         params: dict[str, Any] = {"limit": limit, "offset": offset}
         if retrieval_filter.dataset_uri_ilike:
@@ -526,13 +531,16 @@ def get_all_datasets(
         datasets = []
         offset = 0
         retrieval_filter = retrieval_filter or AirflowFilter()
+        # Every producing task and consuming dag of every dataset is checked against dag_ids, so
+        # build the lookup set once rather than scanning the sequence per check.
+        dag_id_set = set(dag_ids) if dag_ids else None
 
         while True:
             batch = self._get_datasets(
                 limit=batch_size,
                 offset=offset,
                 retrieval_filter=retrieval_filter,
-                dag_ids=dag_ids,
+                dag_ids=dag_id_set,
             )
 
             datasets.extend(batch)
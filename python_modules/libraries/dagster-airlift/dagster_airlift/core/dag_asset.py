@@ -42,31 +42,31 @@ def get_leaf_assets_for_dag(
 ) -> set[AssetKey]:
     # An asset is a "leaf" for the dag if it has no transitive dependencies _within_ the dag. It may have
     # dependencies _outside_ the dag.
-    leaf_assets = []
     cache = {}
-    for asset_key in asset_keys_in_dag:
-        if (
-            get_transitive_dependencies_for_asset(
-                asset_key, downstreams_asset_dependency_graph, cache
-            ).intersection(asset_keys_in_dag)
-            == set()
-        ):
-            leaf_assets.append(asset_key)
-    return set(leaf_assets)
+    return {
+        asset_key
+        for asset_key in asset_keys_in_dag
+        if not has_transitive_dependency_in_dag(
+            asset_key, asset_keys_in_dag, downstreams_asset_dependency_graph, cache
+        )
+    }
 
 
-def get_transitive_dependencies_for_asset(
+def has_transitive_dependency_in_dag(
     asset_key: AssetKey,
+    asset_keys_in_dag: set[AssetKey],
     downstreams_asset_dependency_graph: dict[AssetKey, set[AssetKey]],
-    cache: dict[AssetKey, set[AssetKey]],
-) -> set[AssetKey]:
-    if asset_key in cache:
-        return cache[asset_key]
-    transitive_deps = set()
-    for dep in downstreams_asset_dependency_graph[asset_key]:
-        transitive_deps.add(dep)
-        transitive_deps.update(
-            get_transitive_dependencies_for_asset(dep, downstreams_asset_dependency_graph, cache)
+    cache: dict[AssetKey, bool],
+) -> bool:
+    # Only whether some transitive dependency lands in the dag matters, so memoize that answer per
+    # asset instead of materializing each asset's full set of transitive dependencies. Each asset
+    # and edge is then visited at most once per dag, and the search stops at the first hit.
+    if asset_key not in cache:
+        cache[asset_key] = any(
+            dep in asset_keys_in_dag
+            or has_transitive_dependency_in_dag(
+                dep, asset_keys_in_dag, downstreams_asset_dependency_graph, cache
+            )
+            for dep in downstreams_asset_dependency_graph.get(asset_key, ())
         )
-    cache[asset_key] = transitive_deps
-    return transitive_deps
+    return cache[asset_key]
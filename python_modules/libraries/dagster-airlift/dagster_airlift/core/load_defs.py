@@ -25,6 +25,7 @@
 )
 from dagster_airlift.core.serialization.compute import DagSelectorFn, compute_serialized_data
 from dagster_airlift.core.serialization.defs_construction import (
+    construct_dag_asset_specs,
     construct_dag_assets_defs,
     get_airflow_data_to_spec_mapper,
 )
@@ -240,12 +241,13 @@ def only_include_dag(dag_info: DagInfo) -> bool:
         *_apply_airflow_data_to_specs(assets_to_apply_airflow_data, serialized_airflow_data),
         *construct_dag_assets_defs(serialized_airflow_data),
     ]
-    fully_resolved_assets_definitions = [
+    # Consumed once by replace_assets_in_defs, so don't materialize an intermediate list.
+    fully_resolved_assets_definitions = (
         external_asset_from_spec(asset)
         if isinstance(asset, AssetSpec)
         else cast("AssetsDefinition", asset)
         for asset in mapped_and_constructed_assets
-    ]
+    )
     defs_with_airflow_assets = replace_assets_in_defs(
         defs=defs, assets=fully_resolved_assets_definitions
     )
@@ -308,7 +310,7 @@ def enrich_airflow_mapped_assets(
         source_code_retrieval_enabled=source_code_retrieval_enabled,
         retrieval_filter=retrieval_filter or AirflowFilter(),
     ).get_or_fetch_state()
-    return list(_apply_airflow_data_to_specs(mapped_assets, serialized_data))
+    return _apply_airflow_data_to_specs(mapped_assets, serialized_data)
 
 
 @beta
@@ -327,7 +329,7 @@ def load_airflow_dag_asset_specs(
         source_code_retrieval_enabled=source_code_retrieval_enabled,
         retrieval_filter=retrieval_filter or AirflowFilter(),
     ).get_or_fetch_state()
-    return list(spec_iterator(construct_dag_assets_defs(serialized_data)))
+    return list(construct_dag_asset_specs(serialized_data))
 
 
 def uri_to_asset_key(uri: str) -> AssetKey:
@@ -67,12 +67,16 @@ def scheduled_twice(): ...
         )
 
     """
+    # Built once and shared by every spec; specs only ever read this metadata.
+    task_mapping_metadata = {
+        TASK_MAPPING_METADATA_KEY: [
+            {"dag_id": handle["dag_id"], "task_id": handle["task_id"]} for handle in task_handles
+        ]
+    }
     return [
-        asset.map_asset_specs(
-            lambda spec: spec_with_metadata(spec, {TASK_MAPPING_METADATA_KEY: task_handles})
-        )
+        asset.map_asset_specs(lambda spec: spec_with_metadata(spec, task_mapping_metadata))
         if isinstance(asset, AssetsDefinition)
-        else spec_with_metadata(asset, {TASK_MAPPING_METADATA_KEY: task_handles})
+        else spec_with_metadata(asset, task_mapping_metadata)
         for asset in assets
     ]
 
@@ -1,5 +1,6 @@
 from collections import defaultdict
 from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 from typing import TYPE_CHECKING, AbstractSet, Callable, Optional  # noqa: UP035
 
@@ -79,31 +80,40 @@ def all_mapped_asset_keys_by_dag_id(self) -> dict[str, set[AssetKey]]:
     def asset_keys_by_mapped_task_id(self) -> dict[str, dict[str, set[AssetKey]]]:
         """Mapping of dag_id to task_id to set of asset_keys mapped from that task."""
         asset_key_map: dict[str, dict[str, set[AssetKey]]] = defaultdict(lambda: defaultdict(set))
-        for spec in self.asset_specs:
-            if is_task_mapped_asset_spec(spec):
-                for task_handle in task_handles_for_spec(spec):
-                    asset_key_map[task_handle.dag_id][task_handle.task_id].add(spec.key)
+        for asset_key, task_handles in self.task_handle_map.items():
+            for task_handle in task_handles:
+                asset_key_map[task_handle.dag_id][task_handle.task_id].add(asset_key)
         return asset_key_map
 
     @cached_property
     def asset_keys_by_mapped_dag_id(self) -> dict[str, set[AssetKey]]:
         """Mapping of dag_id to set of asset_keys mapped from that dag."""
         asset_key_map: dict[str, set[AssetKey]] = defaultdict(set)
-        for spec in self.asset_specs:
-            if is_dag_mapped_asset_spec(spec):
-                for dag_handle in dag_handles_for_spec(spec):
-                    asset_key_map[dag_handle.dag_id].add(spec.key)
+        for asset_key, dag_handles in self.dag_handle_map.items():
+            for dag_handle in dag_handles:
+                asset_key_map[dag_handle.dag_id].add(asset_key)
         return asset_key_map
 
     @cached_property
     def task_handle_map(self) -> dict[AssetKey, set[TaskHandle]]:
+        """Mapping of asset_key to the set of task handles it is mapped to.
+
+        This is the only place task mapping metadata is parsed; the other task-based indexes are
+        derived from it.
+        """
         task_handle_map = defaultdict(set)
-        for dag_id, asset_key_by_task_id in self.asset_keys_by_mapped_task_id.items():
-            for task_id, asset_keys in asset_key_by_task_id.items():
-                for asset_key in asset_keys:
-                    task_handle_map[asset_key].add(TaskHandle(dag_id=dag_id, task_id=task_id))
+        for spec in self.mapped_task_asset_specs:
+            task_handle_map[spec.key].update(task_handles_for_spec(spec))
         return task_handle_map
 
+    @cached_property
+    def dag_handle_map(self) -> dict[AssetKey, set[DagHandle]]:
+        """Mapping of asset_key to the set of dag handles it is mapped to."""
+        dag_handle_map = defaultdict(set)
+        for spec in self.mapped_dag_asset_specs:
+            dag_handle_map[spec.key].update(dag_handles_for_spec(spec))
+        return dag_handle_map
+
     @cached_property
     def downstream_deps(self) -> dict[AssetKey, set[AssetKey]]:
         downstreams = defaultdict(set)
@@ -129,17 +139,25 @@ class FetchedAirflowData:
 
     @cached_property
     def all_mapped_tasks(self) -> dict[AssetKey, AbstractSet[TaskHandle]]:
-        return {
-            spec.key: task_handles_for_spec(spec)
-            for spec in self.mapping_info.mapped_task_asset_specs
-        }
+        return dict(self.mapping_info.task_handle_map)
 
     @cached_property
     def all_mapped_dags(self) -> dict[AssetKey, AbstractSet[DagHandle]]:
-        return {
-            spec.key: dag_handles_for_spec(spec)
-            for spec in self.mapping_info.mapped_dag_asset_specs
-        }
+        return dict(self.mapping_info.dag_handle_map)
+
+
+def _fetch_task_infos(
+    airflow_instance: AirflowInstance, dag_ids: Sequence[str]
+) -> list[list[TaskInfo]]:
+    max_workers = min(airflow_instance.max_concurrent_requests, len(dag_ids))
+    if max_workers <= 1:
+        return [airflow_instance.get_task_infos(dag_id=dag_id) for dag_id in dag_ids]
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="airlift_task_info_fetch"
+    ) as executor:
+        return list(
+            executor.map(lambda dag_id: airflow_instance.get_task_infos(dag_id=dag_id), dag_ids)
+        )
 
 
 def fetch_all_airflow_data(
@@ -156,18 +174,20 @@ def fetch_all_airflow_data(
     }
 
     # To limit the number of API calls, only fetch task infos for the dags that we absolutely have to.
+    # Explicitly don't fetch task information for dags that have no mapped tasks,
+    # unless automapping is enabled.
+    dag_ids_to_fetch = [
+        dag_id
+        for dag_id in dag_infos.keys()
+        if automapping_enabled or len(mapping_info.task_id_map[dag_id]) > 0
+    ]
     # Airflow has no batch API for fetching task infos, so we have to fetch them one dag
-    # at a time.
+    # at a time. The requests are independent, so the instance may opt in to overlapping them.
     task_info_map = defaultdict(dict)
-    for dag_id in dag_infos.keys():
-        # Explicitly don't fetch task information for dags that have no mapped tasks,
-        # unless automapping is enabled.
-        if len(mapping_info.task_id_map[dag_id]) == 0 and not automapping_enabled:
-            continue
-        task_info_map[dag_id] = {
-            task_info.task_id: task_info
-            for task_info in airflow_instance.get_task_infos(dag_id=dag_id)
-        }
+    for dag_id, task_infos in zip(
+        dag_ids_to_fetch, _fetch_task_infos(airflow_instance, dag_ids_to_fetch)
+    ):
+        task_info_map[dag_id] = {task_info.task_id: task_info for task_info in task_infos}
 
     if retrieval_filter.retrieve_datasets:
         datasets = airflow_instance.get_all_datasets(
@@ -191,6 +211,20 @@ def infer_code_retrieval_enabled(
     return source_code_retrieval_enabled
 
 
+def fetch_dag_source_code_by_file_token(
+    airflow_instance: AirflowInstance, dag_infos: Iterable[DagInfo]
+) -> dict[str, str]:
+    """Mapping of file token to dag source code. Dags defined in the same file share a file token,
+    so each file's source code is only fetched once.
+    """
+    source_code_by_file_token = {}
+    for dag_info in dag_infos:
+        file_token = dag_info.metadata["file_token"]
+        if file_token not in source_code_by_file_token:
+            source_code_by_file_token[file_token] = airflow_instance.get_dag_source_code(file_token)
+    return source_code_by_file_token
+
+
 def compute_serialized_data(
     airflow_instance: AirflowInstance,
     mapped_assets: Iterable["MappedAsset"],
@@ -210,6 +244,13 @@ def compute_serialized_data(
     source_code_retrieval_enabled = infer_code_retrieval_enabled(
         source_code_retrieval_enabled, fetched_airflow_data
     )
+    source_code_by_file_token = (
+        fetch_dag_source_code_by_file_token(
+            airflow_instance, fetched_airflow_data.dag_infos.values()
+        )
+        if source_code_retrieval_enabled
+        else {}
+    )
     return SerializedAirflowDefinitionsData(
         instance_name=airflow_instance.name,
         key_scoped_task_handles=[
@@ -224,9 +265,7 @@ def compute_serialized_data(
             dag_id: SerializedDagData(
                 dag_id=dag_id,
                 dag_info=dag_info,
-                source_code=airflow_instance.get_dag_source_code(dag_info.metadata["file_token"])
-                if source_code_retrieval_enabled
-                else None,
+                source_code=source_code_by_file_token.get(dag_info.metadata["file_token"]),
                 leaf_asset_keys=get_leaf_assets_for_dag(
                     asset_keys_in_dag=mapping_info.all_mapped_asset_keys_by_dag_id[dag_id],
                     downstreams_asset_dependency_graph=mapping_info.downstream_deps,
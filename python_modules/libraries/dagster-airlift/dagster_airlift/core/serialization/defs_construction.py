@@ -1,4 +1,5 @@
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
+from functools import lru_cache
 from typing import AbstractSet, Any, Callable  # noqa: UP035
 
 from dagster import AssetKey, AssetSpec, JsonMetadataValue, UrlMetadataValue
@@ -71,18 +72,20 @@ def enrich_spec_with_airflow_dag_metadata(
     )
 
 
-def make_dag_external_asset(instance_name: str, dag_data: SerializedDagData) -> AssetsDefinition:
-    return external_asset_from_spec(
-        AssetSpec(
-            key=make_default_dag_asset_key(instance_name, dag_data.dag_id),
-            description=dag_description(dag_data.dag_info),
-            metadata=peered_dag_asset_metadata(dag_data.dag_info, dag_data.source_code),
-            tags={**airflow_kind_dict(), f"{KIND_PREFIX}dag": ""},
-            deps=dag_data.leaf_asset_keys,
-        )
+def make_dag_asset_spec(instance_name: str, dag_data: SerializedDagData) -> AssetSpec:
+    return AssetSpec(
+        key=make_default_dag_asset_key(instance_name, dag_data.dag_id),
+        description=dag_description(dag_data.dag_info),
+        metadata=peered_dag_asset_metadata(dag_data.dag_info, dag_data.source_code),
+        tags={**airflow_kind_dict(), f"{KIND_PREFIX}dag": ""},
+        deps=dag_data.leaf_asset_keys,
     )
 
 
+def make_dag_external_asset(instance_name: str, dag_data: SerializedDagData) -> AssetsDefinition:
+    return external_asset_from_spec(make_dag_asset_spec(instance_name, dag_data))
+
+
 def get_airflow_data_to_spec_mapper(
     serialized_data: SerializedAirflowDefinitionsData,
 ) -> Callable[[AssetSpec], AssetSpec]:
@@ -102,6 +105,13 @@ def _fn(spec: AssetSpec) -> AssetSpec:
     return _fn
 
 
+def construct_dag_asset_specs(
+    serialized_data: SerializedAirflowDefinitionsData,
+) -> Iterator[AssetSpec]:
+    for dag_data in serialized_data.dag_datas.values():
+        yield make_dag_asset_spec(serialized_data.instance_name, dag_data)
+
+
 def construct_dag_assets_defs(
     serialized_data: SerializedAirflowDefinitionsData,
 ) -> Sequence[AssetsDefinition]:
@@ -142,6 +152,13 @@ def construct_automapped_dag_assets_defs(
     dag_specs = []
     task_specs = []
     for dag_data in serialized_data.dag_datas.values():
+        # Build each task's asset key once and reuse it wherever the task appears as a dep.
+        task_asset_keys = {
+            task_id: key_for_automapped_task_asset(
+                serialized_data.instance_name, dag_data.dag_id, task_id
+            )
+            for task_id in dag_data.task_infos
+        }
         leaf_tasks = set()
         upstream_deps: dict[str, set[str]] = {task_id: set() for task_id in dag_data.task_infos}
         for task_id, task_info in dag_data.task_infos.items():
@@ -152,15 +169,8 @@ def construct_automapped_dag_assets_defs(
 
         task_specs.extend(
             AssetSpec(
-                key=key_for_automapped_task_asset(
-                    serialized_data.instance_name, dag_data.dag_id, task_id
-                ),
-                deps=[
-                    key_for_automapped_task_asset(
-                        serialized_data.instance_name, dag_data.dag_id, upstream_task_id
-                    )
-                    for upstream_task_id in upstream_task_ids
-                ],
+                key=task_asset_keys[task_id],
+                deps=[task_asset_keys[upstream_task_id] for upstream_task_id in upstream_task_ids],
                 description=description_for_automapped_task_asset(dag_data.task_infos[task_id]),
                 tags=tags_for_automapped_task_asset(),
                 metadata=metadata_for_automapped_task_asset(dag_data.task_infos[task_id]),
@@ -174,20 +184,16 @@ def construct_automapped_dag_assets_defs(
                 description=dag_description(dag_data.dag_info),
                 metadata=peered_dag_asset_metadata(dag_data.dag_info, dag_data.source_code),
                 tags=airflow_kind_dict(),
-                deps=set(
-                    [
-                        key_for_automapped_task_asset(
-                            serialized_data.instance_name, dag_data.dag_id, task_id
-                        )
-                        for task_id in leaf_tasks
-                    ]
-                ).union(dag_data.leaf_asset_keys),
+                deps={task_asset_keys[task_id] for task_id in leaf_tasks}.union(
+                    dag_data.leaf_asset_keys
+                ),
             )
         )
 
     return task_specs + dag_specs
 
 
+@lru_cache(maxsize=8192)
 def make_default_dag_asset_key(instance_name: str, dag_id: str) -> AssetKey:
     """Conventional asset key representing a successful run of an airfow dag."""
     return AssetKey([instance_name, "dag", convert_to_valid_dagster_name(dag_id)])
@@ -10,6 +10,7 @@
 from dagster._annotations import PublicAttr, beta
 from dagster._record import record
 from dagster._serdes import whitelist_for_serdes
+from dagster._utils.interning import BoundedInternPool
 
 from dagster_airlift.constants import (
     DAG_ID_TAG_KEY,
@@ -66,10 +67,27 @@ def file_token(self) -> str:
         return self.metadata["file_token"]
 
 
+# The handle classes declare empty __slots__ so that subclassing the namedtuple base doesn't add a
+# per-instance __dict__.
+_MAX_INTERNED_HANDLES = 65536
+_interned_task_handles: BoundedInternPool[tuple[type, str, str], "TaskHandle"] = BoundedInternPool(
+    _MAX_INTERNED_HANDLES
+)
+_interned_dag_handles: BoundedInternPool[tuple[type, str], "DagHandle"] = BoundedInternPool(
+    _MAX_INTERNED_HANDLES
+)
+
+
 @whitelist_for_serdes
-class TaskHandle(NamedTuple):
-    dag_id: str
-    task_id: str
+class TaskHandle(NamedTuple("_TaskHandle", [("dag_id", str), ("task_id", str)])):
+    __slots__ = ()
+
+    def __new__(cls, dag_id: str, task_id: str):
+        new = super().__new__
+        return _interned_task_handles.intern(
+            (cls, dag_id, task_id),
+            lambda: new(cls, dag_id=dag_id, task_id=task_id),
+        )
 
     @property
     def metadata_key(self) -> str:
@@ -91,8 +109,12 @@ def identifying_tags(self) -> dict[str, str]:
 
 
 @whitelist_for_serdes
-class DagHandle(NamedTuple):
-    dag_id: str
+class DagHandle(NamedTuple("_DagHandle", [("dag_id", str)])):
+    __slots__ = ()
+
+    def __new__(cls, dag_id: str):
+        new = super().__new__
+        return _interned_dag_handles.intern((cls, dag_id), lambda: new(cls, dag_id=dag_id))
 
     @property
     def metadata_key(self) -> str:
@@ -152,6 +174,8 @@ def is_produced_by_task(self, *, task_id: str, dag_id: str) -> bool:
 class SerializedDagData:
     """A record containing pre-computed data about a given airflow dag."""
 
+    __slots__ = ()
+
     dag_id: str
     dag_info: DagInfo
     source_code: Optional[str]
@@ -162,6 +186,8 @@ class SerializedDagData:
 @whitelist_for_serdes
 @record
 class KeyScopedTaskHandles:
+    __slots__ = ()
+
     asset_key: AssetKey
     mapped_tasks: AbstractSet[TaskHandle]
 
@@ -169,6 +195,8 @@ class KeyScopedTaskHandles:
 @whitelist_for_serdes
 @record
 class KeyScopedDagHandles:
+    __slots__ = ()
+
     asset_key: AssetKey
     mapped_dags: AbstractSet[DagHandle]
 
@@ -1,3 +1,4 @@
+import re
 from collections.abc import Iterable, Iterator, Mapping, Sequence
 from typing import TYPE_CHECKING, Any, Optional, Union
 
@@ -12,7 +13,7 @@
 )
 from dagster._core.definitions.definitions_class import Definitions
 from dagster._core.definitions.job_definition import JobDefinition
-from dagster._core.definitions.utils import VALID_NAME_REGEX
+from dagster._core.definitions.utils import INVALID_NAME_CHARS
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.storage.tags import EXTERNAL_JOB_SOURCE_TAG_KEY, KIND_PREFIX
 
@@ -28,9 +29,12 @@
     from dagster_airlift.core.serialization.serialized_data import DagHandle, TaskHandle
 
 
+_INVALID_NAME_CHARS_REGEX = re.compile(INVALID_NAME_CHARS)
+
+
 def convert_to_valid_dagster_name(name: str) -> str:
     """Converts a name to a valid dagster name by replacing invalid characters with underscores. / is converted to a double underscore."""
-    return "".join(c if VALID_NAME_REGEX.match(c) else "__" if c == "/" else "_" for c in name)
+    return _INVALID_NAME_CHARS_REGEX.sub("_", name.replace("/", "__"))
 
 
 def airflow_kind_dict() -> dict:
@@ -85,12 +89,10 @@ def task_handles_for_spec(spec: AssetSpec) -> set["TaskHandle"]:
     from dagster_airlift.core.serialization.serialized_data import TaskHandle
 
     check.param_invariant(is_task_mapped_asset_spec(spec), "spec", "Must be mapped spec")
-    task_handles = []
-    for task_handle_dict in spec.metadata[TASK_MAPPING_METADATA_KEY]:
-        task_handles.append(
-            TaskHandle(dag_id=task_handle_dict["dag_id"], task_id=task_handle_dict["task_id"])
-        )
-    return set(task_handles)
+    return {
+        TaskHandle(dag_id=task_handle_dict["dag_id"], task_id=task_handle_dict["task_id"])
+        for task_handle_dict in spec.metadata[TASK_MAPPING_METADATA_KEY]
+    }
 
 
 def dag_handles_for_spec(spec: AssetSpec) -> set["DagHandle"]:
@@ -113,15 +115,6 @@ def peered_dag_handles_for_spec(spec: AssetSpec) -> set["DagHandle"]:
     }
 
 
-def get_producing_dag_ids(spec: AssetSpec) -> set[str]:
-    if is_dag_mapped_asset_spec(spec):
-        return {dag_handle.dag_id for dag_handle in dag_handles_for_spec(spec)}
-    if is_peered_dag_asset_spec(spec):
-        return {dag_handle.dag_id for dag_handle in peered_dag_handles_for_spec(spec)}
-    else:
-        return {task_handle.dag_id for task_handle in task_handles_for_spec(spec)}
-
-
 MappedAsset = Union[AssetSpec, AssetsDefinition]
 
 
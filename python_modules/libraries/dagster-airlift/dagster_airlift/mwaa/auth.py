@@ -1,3 +1,4 @@
+import threading
 from typing import Any, Optional
 
 import boto3
@@ -66,6 +67,7 @@ def __init__(self, mwaa_client: Any, env_name: str) -> None:
         self.env_name = env_name
         # Session info is generated when we either try to retrieve a session or retrieve the web server url
         self._session_info: Optional[tuple[str, str]] = None
+        self._session_info_lock = threading.Lock()
 
     @staticmethod
     def from_profile(region: str, env_name: str, profile_name: Optional[str] = None):
@@ -73,11 +75,17 @@ def from_profile(region: str, env_name: str, profile_name: Optional[str] = None)
         mwaa = boto_session.client("mwaa")
         return MwaaSessionAuthBackend(mwaa_client=mwaa, env_name=env_name)
 
+    def _get_session_info(self) -> tuple[str, str]:
+        # Sessions may be requested from several threads at once, so make sure only one of them
+        # requests a web login token.
+        with self._session_info_lock:
+            if not self._session_info:
+                self._session_info = get_session_info(mwaa=self.mwaa_client, env_name=self.env_name)
+            return self._session_info
+
     def get_session(self) -> requests.Session:
         # Get the session info
-        if not self._session_info:
-            self._session_info = get_session_info(mwaa=self.mwaa_client, env_name=self.env_name)
-        session_cookie = self._session_info[1]
+        session_cookie = self._get_session_info()[1]
         # Create a new session
         session = requests.Session()
         session.cookies.set("session", session_cookie)
@@ -86,6 +94,4 @@ def get_session(self) -> requests.Session:
         return session
 
     def get_webserver_url(self) -> str:
-        if not self._session_info:
-            self._session_info = get_session_info(mwaa=self.mwaa_client, env_name=self.env_name)
-        return f"https://{self._session_info[0]}"
+        return f"https://{self._get_session_info()[0]}"
@@ -47,6 +47,9 @@ def __init__(
         self._task_infos_by_dag_and_task_id = {
             (task_info.dag_id, task_info.task_id): task_info for task_info in task_infos
         }
+        self._task_infos_by_dag_id: dict[str, list[TaskInfo]] = defaultdict(list)
+        for task_info in self._task_infos_by_dag_and_task_id.values():
+            self._task_infos_by_dag_id[task_info.dag_id].append(task_info)
         self._task_instances_by_dag_and_task_id: dict[tuple[str, str], list[TaskInstance]] = (
             defaultdict(list)
         )
@@ -73,24 +76,16 @@ def __init__(
 
     def list_dags(self, retrieval_filter: Optional[AirflowFilter] = None) -> list[DagInfo]:
         retrieval_filter = retrieval_filter or AirflowFilter()
-        # Very basic filtering for testing purposes
-        dags_to_retrieve = list(self._dag_infos_by_dag_id.values())
-        if retrieval_filter.dag_id_ilike:
-            dags_to_retrieve = [
-                dag_info
-                for dag_info in dags_to_retrieve
-                if retrieval_filter.dag_id_ilike in dag_info.dag_id
-            ]
-        if retrieval_filter.airflow_tags:
-            dags_to_retrieve = [
-                dag_info
-                for dag_info in dags_to_retrieve
-                if all(
-                    tag in dag_info.metadata.get("tags", [])
-                    for tag in retrieval_filter.airflow_tags
-                )
-            ]
-        return dags_to_retrieve
+        # Very basic filtering for testing purposes, done in a single pass over the dags.
+        # Tags are compared by membership since Airflow may return them as unhashable dicts.
+        dag_id_ilike = retrieval_filter.dag_id_ilike
+        required_tags = retrieval_filter.airflow_tags or []
+        return [
+            dag_info
+            for dag_info in self._dag_infos_by_dag_id.values()
+            if (not dag_id_ilike or dag_id_ilike in dag_info.dag_id)
+            and all(tag in dag_info.metadata.get("tags", []) for tag in required_tags)
+        ]
 
     def list_variables(self) -> list[dict[str, Any]]:
         return self._variables
@@ -211,11 +206,7 @@ def get_task_info(self, dag_id, task_id) -> TaskInfo:  # pyright: ignore[reportI
     def get_task_infos(self, *, dag_id: str) -> list[TaskInfo]:
         if dag_id not in self._dag_infos_by_dag_id:
             raise ValueError(f"Dag info not found for dag_id {dag_id}")
-        task_infos = []
-        for dag_id, task_id in self._task_infos_by_dag_and_task_id:
-            if dag_id == dag_id:
-                task_infos.append(self._task_infos_by_dag_and_task_id[(dag_id, task_id)])
-        return task_infos
+        return list(self._task_infos_by_dag_id[dag_id])
 
     def get_dag_info(self, dag_id) -> DagInfo:
         if dag_id not in self._dag_infos_by_dag_id:
@@ -9,7 +9,7 @@
     build_airlift_metadata_mapping_info,
     fetch_all_airflow_data,
 )
-from dagster_airlift.core.serialization.serialized_data import TaskInfo
+from dagster_airlift.core.serialization.serialized_data import DagHandle, TaskInfo
 from dagster_airlift.core.utils import metadata_for_task_mapping
 from dagster_airlift.test import AirflowInstanceFake
 
@@ -187,3 +187,56 @@ def test_produce_fetched_airflow_data() -> None:
     assert len(fetched_airflow_data.mapping_info.mapped_task_asset_specs) == 1
     assert len(list(fetched_airflow_data.mapping_info.asset_specs)) == 2
     assert fetched_airflow_data.mapping_info.downstream_deps == {ak("asset1"): {ak("asset2")}}
+
+
+def test_fetch_task_infos_concurrently() -> None:
+    dag_ids = [f"dag{i}" for i in range(5)]
+    mapping_info = build_airlift_metadata_mapping_info(
+        mapped_assets=[airlift_asset_spec(f"asset_{dag_id}", dag_id, "task1") for dag_id in dag_ids]
+    )
+
+    def _fetch(max_concurrent_requests: int) -> dict:
+        instance = AirflowInstanceFake(
+            dag_infos=[
+                DagInfo(
+                    dag_id=dag_id,
+                    metadata={"file_token": f"{dag_id}_file_token"},
+                    webserver_url="http://localhost:8080",
+                )
+                for dag_id in dag_ids
+            ],
+            task_infos=[
+                TaskInfo(
+                    dag_id=dag_id,
+                    task_id="task1",
+                    metadata={},
+                    webserver_url="http://localhost:8080",
+                )
+                for dag_id in dag_ids
+            ],
+            task_instances=[],
+            dag_runs=[],
+        )
+        instance.max_concurrent_requests = max_concurrent_requests
+        return fetch_all_airflow_data(
+            airflow_instance=instance,
+            mapping_info=mapping_info,
+            dag_selector_fn=None,
+            automapping_enabled=False,
+            retrieval_filter=AirflowFilter(),
+        ).task_info_map
+
+    task_info_map = _fetch(max_concurrent_requests=1)
+    assert list(task_info_map.keys()) == dag_ids
+    assert _fetch(max_concurrent_requests=4) == task_info_map
+
+
+def test_handles_interned() -> None:
+    spec = airlift_asset_spec("asset1", "dag1", "task1")
+    mapping_info = build_airlift_metadata_mapping_info(mapped_assets=[spec])
+    (task_handle,) = mapping_info.task_handle_map[ak("asset1")]
+    assert task_handle is TaskHandle(dag_id="dag1", task_id="task1")
+    assert TaskHandle(dag_id="dag1", task_id="task1") is not TaskHandle(
+        dag_id="dag1", task_id="task2"
+    )
+    assert DagHandle(dag_id="dag1") is DagHandle(dag_id="dag1")
@@ -1,5 +1,4 @@
 from pathlib import Path
-from typing import cast
 from unittest import mock
 
 from dagster import (
@@ -25,7 +24,7 @@
     scoped_reconstruction_metadata,
     unwrap_reconstruction_metadata,
 )
-from dagster_airlift.constants import TASK_MAPPING_METADATA_KEY
+from dagster_airlift.constants import DAG_MAPPING_METADATA_KEY, TASK_MAPPING_METADATA_KEY
 from dagster_airlift.core import assets_with_task_mappings, build_defs_from_airflow_instance
 from dagster_airlift.core.airflow_defs_data import AirflowDefinitionsData
 from dagster_airlift.core.filter import AirflowFilter
@@ -46,7 +45,7 @@
     TaskHandle,
 )
 from dagster_airlift.core.utils import is_task_mapped_asset_spec, metadata_for_task_mapping
-from dagster_airlift.test import asset_spec, make_instance
+from dagster_airlift.test import AirflowInstanceFake, asset_spec, make_dag_info, make_instance
 from dagster_shared.serdes import deserialize_value
 from dagster_test.utils.definitions_execute_in_process import get_job_from_defs
 
@@ -116,13 +115,10 @@ def test_defs_passthrough() -> None:
     assert defs.executor == nonstandard_executor
     assert defs.loggers
     assert len(defs.loggers) == 1
-    assert next(iter(defs.loggers.keys())) == "the_logger"
+    assert "the_logger" in defs.loggers
     assert defs.sensors
     assert len(list(defs.sensors)) == 2
-    our_sensor = next(
-        iter(sensor_def for sensor_def in defs.sensors if sensor_def.name == "some_sensor")
-    )
-    assert our_sensor == some_sensor
+    assert defs.get_unresolved_sensor_def("some_sensor") == some_sensor
     assert defs.schedules
     assert len(list(defs.schedules)) == 1
     assert next(iter(defs.schedules)) == some_schedule
@@ -386,11 +382,10 @@ def test_cached_loading() -> None:
             assert mock_compute_serialized_data.call_count == 0
             assert reloaded_repo_def.assets_defs_by_key
             assert len(list(reloaded_repo_def.assets_defs_by_key.keys())) == 2
-            assert {
-                key
-                for assets_def in reloaded_repo_def.assets_defs_by_key.values()
-                for key in cast("AssetsDefinition", assets_def).keys
-            } == {AssetKey("a"), make_test_dag_asset_key("dag")}
+            assert set(reloaded_repo_def.assets_defs_by_key.keys()) == {
+                AssetKey("a"),
+                make_test_dag_asset_key("dag"),
+            }
 
 
 def test_multiple_tasks_per_asset(init_load_context: None) -> None:
@@ -414,19 +409,17 @@ def my_asset():
     assert defs.assets
     # 3 Full assets definitions, but 4 keys
     assert len(list(defs.assets)) == 3
-    assert {
-        key for assets_def in defs.assets for key in cast("AssetsDefinition", assets_def).keys
-    } == {
+    repo_def = defs.get_repository_def()
+    assert set(repo_def.assets_defs_by_key.keys()) == {
         AssetKey("a"),
         AssetKey("b"),
         make_test_dag_asset_key("dag1"),
         make_test_dag_asset_key("dag2"),
     }
-    repo_def = defs.get_repository_def()
     a_and_b_asset = repo_def.assets_defs_by_key[AssetKey("a")]
-    a_spec = next(iter(spec for spec in a_and_b_asset.specs if spec.key == AssetKey("a")))
+    a_spec = a_and_b_asset.specs_by_key[AssetKey("a")]
     assert has_single_task_handle(a_spec, "dag1", "task1")
-    b_spec = next(iter(spec for spec in a_and_b_asset.specs if spec.key == AssetKey("b")))
+    b_spec = a_and_b_asset.specs_by_key[AssetKey("b")]
     assert has_single_task_handle(b_spec, "dag2", "task2")
 
 
@@ -684,6 +677,38 @@ def test_enrich() -> None:
     assert spec.metadata["Dag ID"] == "dag"
 
 
+def test_source_code_fetched_once_per_file() -> None:
+    """Dags defined in the same file should share a single source code fetch."""
+    instance = AirflowInstanceFake(
+        dag_infos=[
+            make_dag_info(
+                instance_name="test_instance",
+                dag_id=dag_id,
+                file_token="shared_file",
+                dag_props={},
+            )
+            for dag_id in ["dag1", "dag2"]
+        ],
+        task_infos=[],
+        task_instances=[],
+        dag_runs=[],
+    )
+    with mock.patch.object(
+        instance, "get_dag_source_code", wraps=instance.get_dag_source_code
+    ) as get_dag_source_code:
+        serialized_data = compute_serialized_data(
+            airflow_instance=instance,
+            mapped_assets=[],
+            dag_selector_fn=None,
+            automapping_enabled=False,
+            source_code_retrieval_enabled=True,
+            retrieval_filter=AirflowFilter(),
+        )
+    get_dag_source_code.assert_called_once_with("shared_file")
+    assert serialized_data.dag_datas["dag1"].source_code == "indicates found source code"
+    assert serialized_data.dag_datas["dag2"].source_code == "indicates found source code"
+
+
 def test_load_dags() -> None:
     dag_assets = load_airflow_dag_asset_specs(
         airflow_instance=make_instance({"dag": ["task"]}),
@@ -873,3 +898,21 @@ def b():
         "consumer1": {AssetKey("example2")},
         "consumer2": set(),
     }
+
+
+def test_empty_mapping_metadata_kept() -> None:
+    """Specs whose mapping metadata is an empty list are still recorded, with no handles."""
+    instance = AirflowInstanceFake(dag_infos=[], task_infos=[], task_instances=[], dag_runs=[])
+    serialized_data = compute_serialized_data(
+        airflow_instance=instance,
+        mapped_assets=[
+            AssetSpec(key="a", metadata={TASK_MAPPING_METADATA_KEY: []}),
+            AssetSpec(key="b", metadata={DAG_MAPPING_METADATA_KEY: []}),
+        ],
+        dag_selector_fn=None,
+        automapping_enabled=False,
+        source_code_retrieval_enabled=False,
+        retrieval_filter=AirflowFilter(),
+    )
+    assert serialized_data.all_mapped_tasks == {AssetKey("a"): set()}
+    assert serialized_data.all_mapped_dags == {AssetKey("b"): set()}
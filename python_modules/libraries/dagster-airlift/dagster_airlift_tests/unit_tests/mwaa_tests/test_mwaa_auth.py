@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import boto3
@@ -24,3 +25,14 @@ def test_mwaa_session_auth_direct_mwaa_client_creation() -> None:
         session = auth_backend.get_session()
         assert session.cookies["session"] == "my-session-cookie"
         assert auth_backend.get_webserver_url() == "https://my-webserver-hostname"
+
+
+def test_mwaa_session_auth_concurrent_sessions() -> None:
+    """Sessions requested from several threads at once should share a single web login token."""
+    with mock.patch("dagster_airlift.mwaa.auth.get_session_info") as mock_get_session_info:
+        mock_get_session_info.return_value = ("my-webserver-hostname", "my-session-cookie")
+        auth_backend = MwaaSessionAuthBackend(mwaa_client=mock.MagicMock(), env_name="my-env")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            sessions = list(executor.map(lambda _: auth_backend.get_session(), range(32)))
+        assert all(session.cookies["session"] == "my-session-cookie" for session in sessions)
+        assert mock_get_session_info.call_count == 1
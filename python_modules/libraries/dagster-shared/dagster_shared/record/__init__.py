@@ -224,6 +224,14 @@ def _namedtuple_record_transform(
     if len(field_set) < 1:
         new_class_dict["__bool__"] = _true
 
+    # records that declare empty __slots__ opt out of a per-instance __dict__
+    if "__slots__" in cls.__dict__:
+        check.invariant(
+            cls.__dict__["__slots__"] == (),
+            f"@record {cls.__name__} can only declare empty __slots__, fields are stored on the tuple.",
+        )
+        new_class_dict["__slots__"] = ()
+
     new_type = type(
         cls.__name__,
         (cls, base),
@@ -931,3 +931,27 @@ def test_runtime_typecheck_pydantic_field() -> None:
         class MyClass:
             foo: str = Field(default="foo")
             bar: Optional[int] = Field(default=None)
+
+
+def test_empty_slots() -> None:
+    @record
+    class Slotted:
+        __slots__ = ()
+
+        foo: str
+
+    @record
+    class Unslotted:
+        foo: str
+
+    assert Slotted(foo="a").foo == "a"
+    assert not hasattr(Slotted(foo="a"), "__dict__")
+    assert hasattr(Unslotted(foo="a"), "__dict__")
+
+    with pytest.raises(CheckError, match="can only declare empty __slots__"):
+
+        @record
+        class BadSlots:
+            __slots__ = ("bar",)
+
+            foo: str